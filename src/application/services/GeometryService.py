@@ -1,14 +1,96 @@
-import ee
-import geopandas as gpd
-import json
+from __future__ import annotations
+
+import importlib.util
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import pygadm
+from typing import TYPE_CHECKING
+import numpy as np
+import shapely
 from shapely import force_2d
+from shapely.geometry import mapping
+
+# ee, geopandas, pygadm and pyproj pull in large dependency trees, so they are
+# imported inside the methods that need them to keep app start-up fast.
+if TYPE_CHECKING:
+    import ee
+    import geopandas as gpd
+    from pyproj import Transformer
+
+WGS84 = "EPSG:4326"
+
+# Fallback for the defaults.simplify_tolerance setting (degrees); keeps shapes
+# sent to Earth Engine under its payload limits
+DEFAULT_SIMPLIFY_TOLERANCE = 0.01
+
+# Above this many vertices, reprojection is split across threads
+# (pyproj releases the GIL while transforming coordinate arrays)
+PARALLEL_REPROJECT_MIN_COORDS = 100_000
+
+
+@lru_cache(maxsize=32)
+def _get_wgs84_transformer(src_crs_wkt: str) -> Transformer:
+    """Returns a cached transformer from the given CRS to WGS84 (lon/lat order)."""
+    from pyproj import Transformer
+
+    return Transformer.from_crs(src_crs_wkt, WGS84, always_xy=True)
+
+
+# GeoDataFrames can be large: keep only the most recent few in memory
+# (older ones are re-read from the GeoParquet cache on disk)
+@lru_cache(maxsize=8)
+def _load_gadm_items(name: str, admin_level: int, cache_folder: str) -> gpd.GeoDataFrame:
+    """
+    Fetches GADM boundaries, memoized in memory and persisted as GeoParquet.
+    GADM layers are static, so a cached file never needs refreshing.
+    """
+    import geopandas as gpd
+
+    cache_dir = Path(cache_folder) / "gadm"
+    safe_name = re.sub(r'[^\w-]+', '_', name)
+    cache_file = cache_dir / f"{safe_name}_{admin_level}.parquet"
+    if cache_file.exists():
+        try:
+            return gpd.read_parquet(cache_file)
+        except Exception as e:
+            print(f"Ignoring unreadable GADM cache {cache_file}: {e}")
+
+    import pygadm
+
+    if admin_level > 0:
+        items = pygadm.Items(name=name, content_level=admin_level)
+    else:
+        items = pygadm.Items(name=name)
+
+    # Cast the pygadm subclass to a vanilla GeoDataFrame before serializing
+    gdf = gpd.GeoDataFrame(items, geometry='geometry')
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        gdf.to_parquet(cache_file)
+    except Exception as e:
+        print(f"Could not write GADM cache {cache_file}: {e}")
+    return gdf
+
 
 class GeometryService:
-    def __init__(self):
-        pass
+    def __init__(self, cache_folder: str = "./.cache/", simplify_tolerance: float = 0.0):
+        """
+        Args:
+            cache_folder: Where downloaded GADM boundaries are cached.
+            simplify_tolerance: If > 0, shapes sent to Earth Engine by parse_geometry
+                                are simplified with this tolerance (degrees).
+                                A good value is analysis scale (m) / 111320.
+        """
+        self.cache_folder = cache_folder
+        self.simplify_tolerance = simplify_tolerance
+        # geometry_type -> parser, built once for parse_geometry
+        self._parsers = {
+            'point': self._parse_point,
+            'shapefile': self._parse_shapefile,
+            'gadm': self._parse_gadm,
+        }
 
     def parse_file(self, file_path: str) -> dict:
         """
@@ -17,6 +99,8 @@ class GeometryService:
         Returns:
             dict: {'type': 'points'|'shapes', 'n_features': int, 'geom_types': list[str]}
         """
+        import geopandas as gpd
+
         try:
             gdf = gpd.read_file(file_path)
             
@@ -41,31 +125,32 @@ class GeometryService:
         except Exception as e:
             raise ValueError(f"Error reading geometry file: {e}")
 
-    def load_file(self, file_path: str, simplify_tolerance: float = 0.0) -> gpd.GeoDataFrame:
+    def load_file(self, file_path: str, simplify_tolerance: float | None = None) -> gpd.GeoDataFrame:
         """
         Read a geometry file on-demand and return a processed GeoDataFrame.
         Called only when data is actually needed (map preview or extraction).
         
         Args:
             file_path: Path to the file
-            simplify_tolerance: If > 0, simplify shape geometries (degrees). 
-                                Use ~0.01 for GEE export to avoid payload limits.
+            simplify_tolerance: If > 0, simplify shape geometries (degrees).
+                                None uses the service's own simplify_tolerance.
         """
+        import geopandas as gpd
+
         gdf = gpd.read_file(file_path)
         
         if gdf.empty:
             raise ValueError("The file contains no geometries.")
         
         # Reproject to WGS84 if needed
-        if gdf.crs and gdf.crs != "EPSG:4326":
-            gdf = gdf.to_crs("EPSG:4326")
-        elif gdf.crs is None:
-            gdf = gdf.set_crs("EPSG:4326")
+        gdf = self._to_wgs84(gdf)
         
         # Drop Z coordinates (common in KML files)
         gdf['geometry'] = gdf['geometry'].apply(force_2d)
         
         # Simplify shapes if requested (reduces GEE payload size)
+        if simplify_tolerance is None:
+            simplify_tolerance = self.simplify_tolerance
         if simplify_tolerance > 0:
             point_types = {'Point', 'MultiPoint'}
             if not set(gdf.geom_type.unique()).issubset(point_types):
@@ -84,88 +169,197 @@ class GeometryService:
         Returns:
             ee.Geometry: The parsed Earth Engine geometry.
         """
-        if geometry_type == 'point':
-            return self._parse_point(data)
-        elif geometry_type == 'shapefile':
-            return self._parse_shapefile(data)
-        elif geometry_type == 'gadm':
-            return self._parse_gadm(data)
-        else:
+        try:
+            parser = self._parsers[geometry_type]
+        except KeyError:
             raise ValueError(f"Unknown geometry type: {geometry_type}")
+        return parser(data)
+
+    def _parse_point(self, data) -> ee.Geometry:
+        """
+        Parses a lat/lon dictionary into a Point, or a list of such dictionaries /
+        a DataFrame with 'lat' and 'lon' columns into a single MultiPoint.
+        """
+        import ee
 
-    def _parse_point(self, data: dict) -> ee.Geometry:
-        """Parses lat/lon dictionary."""
         try:
-            lat = float(data.get('lat'))
-            lon = float(data.get('lon'))
-            return ee.Geometry.Point([lon, lat])
-        except (ValueError, TypeError):
+            if isinstance(data, dict):
+                lat = float(data.get('lat'))
+                lon = float(data.get('lon'))
+                return ee.Geometry.Point([lon, lat])
+
+            if hasattr(data, 'to_numpy'):
+                lats = data['lat'].to_numpy(dtype='float64')
+                lons = data['lon'].to_numpy(dtype='float64')
+            else:
+                lats = np.array([p.get('lat') for p in data], dtype='float64')
+                lons = np.array([p.get('lon') for p in data], dtype='float64')
+
+            if len(lats) == 0 or not (np.isfinite(lats).all() and np.isfinite(lons).all()):
+                raise ValueError("Invalid coordinates provided.")
+
+            # One EE object for all points instead of one per point
+            coords = np.column_stack([lons, lats])
+            return ee.Geometry.MultiPoint(coords.tolist())
+        except (ValueError, TypeError, KeyError, AttributeError):
             raise ValueError("Invalid coordinates provided.")
 
     def _parse_shapefile(self, file_path: str) -> ee.Geometry:
         """
         Parses a shapefile or GeoJSON using geopandas and converts to ee.Geometry.
         """
+        import ee
+        import pyogrio
+
         try:
-            gdf = gpd.read_file(file_path)
+            # Only the geometry is needed: skip every attribute column
+            use_arrow = importlib.util.find_spec("pyarrow") is not None
+            gdf = pyogrio.read_dataframe(file_path, columns=[], use_arrow=use_arrow)
             
             # Reproject to WGS84 if needed
-            if gdf.crs != "EPSG:4326":
-                gdf = gdf.to_crs("EPSG:4326")
-            
-            # Convert to GeoJSON
-            geojson_str = gdf.to_json()
-            geojson_dict = json.loads(geojson_str)
-            
-            # Extract features or geometry
-            # For simplicity, we create a specialized collection or geometry wrapper
-            # ee.Geometry(geojson_geometry)
-            
-            # Initial handling: define a MultiPolygon or FeatureCollection depending on use case.
-            # Best practice: Uploading complex geometries often requires managing feature collections.
-            # For extraction, usually we want the geometry of the ROI.
+            gdf = self._to_wgs84(gdf)
             
+            # For extraction, we want the geometry of the ROI as a single ee.Geometry.
             # Combining all geometries in the file into one MultiPolygon/Polygon
-            combined_geom = gdf.geometry.unary_union
+            combined_geom = self._combine_geometries(gdf.geometry.values)
+
+            # Fewer vertices means a smaller payload and less server-side work
+            if self.simplify_tolerance > 0:
+                combined_geom = combined_geom.simplify(self.simplify_tolerance, preserve_topology=True)
             
-            # Convert shapely geometry to GeoJSON dict
+            # Convert shapely geometry to EE coordinates
             if combined_geom.geom_type == 'Polygon':
-                coords = [list(x) for x in combined_geom.exterior.coords]
-                return ee.Geometry.Polygon(coords)
+                return ee.Geometry.Polygon(self._polygon_rings(combined_geom))
             elif combined_geom.geom_type == 'MultiPolygon':
-               # Handle multipolygon conversion manually or via geojson interface
-               # ee.Geometry.MultiPolygon takes a list of lists of lists of coordinates
-               pass
+                # ee.Geometry.MultiPolygon takes a list of lists of lists of coordinates
+                polygons = [self._polygon_rings(p) for p in shapely.get_parts(combined_geom)]
+                return ee.Geometry.MultiPolygon(polygons)
 
-            # Fallback: simple feature collection from geojson
-            fc = ee.FeatureCollection(geojson_dict)
-            return fc.geometry()
+            # Any other geometry type: ship the GeoJSON of the combined geometry directly,
+            # no server-side FeatureCollection union needed
+            return ee.Geometry(mapping(combined_geom))
 
         except Exception as e:
             raise ValueError(f"Error processing shapefile: {e}")
 
+    def _polygon_rings(self, polygon) -> list:
+        """
+        Returns [exterior, *holes] ring coordinates of a polygon as nested lists,
+        pulling each ring's vertices out in a single vectorized call.
+        """
+        return [shapely.get_coordinates(ring).tolist() for ring in shapely.get_rings(polygon)]
+
+    def _to_wgs84(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Reprojects a GeoDataFrame to WGS84, reusing a cached pyproj Transformer
+        instead of letting geopandas build a fresh one on every to_crs() call.
+        """
+        if gdf.crs is None:
+            # No CRS declared: accept it as WGS84 if the coordinates look like lon/lat
+            minx, miny, maxx, maxy = gdf.total_bounds
+            if -180 <= minx and maxx <= 180 and -90 <= miny and maxy <= 90:
+                return gdf.set_crs(WGS84)
+            raise ValueError("The file has no CRS and its coordinates are not longitude/latitude.")
+
+        if gdf.crs == WGS84:
+            return gdf
+
+        import geopandas as gpd
+
+        transformer = _get_wgs84_transformer(gdf.crs.to_wkt())
+        geoms = np.array(gdf.geometry.values)
+        coords = shapely.get_coordinates(geoms)
+        if len(coords) > PARALLEL_REPROJECT_MIN_COORDS and not shapely.has_z(geoms).any():
+            geoms = self._reproject_parallel(geoms, coords, transformer)
+        else:
+            geoms = shapely.transform(geoms, transformer.transform, interleaved=False)
+        return gdf.set_geometry(
+            gpd.GeoSeries(geoms, index=gdf.index, crs=WGS84, name=gdf.geometry.name)
+        )
+
+    def _reproject_parallel(self, geoms, coords, transformer):
+        """
+        Transforms the flat (N, 2) coordinate array in contiguous slices on a
+        thread pool, then writes the result back into (copies of) the geometries.
+        """
+        def transform_chunk(chunk):
+            return np.column_stack(transformer.transform(chunk[:, 0], chunk[:, 1]))
+
+        max_workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            chunks = pool.map(transform_chunk, np.array_split(coords, max_workers))
+            new_coords = np.vstack(list(chunks))
+        return shapely.set_coordinates(geoms.copy(), new_coords)
+
+    def _to_geojson_dict(self, geoms) -> dict:
+        """
+        Builds a GeoJSON FeatureCollection dict straight from shapely geometries,
+        avoiding the serialize-to-string / parse-back round-trip of gdf.to_json().
+        """
+        return {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "properties": {}, "geometry": mapping(geom)}
+                for geom in geoms
+            ],
+        }
+
+    def _combine_geometries(self, geoms):
+        """
+        Merges an array of shapely geometries into a single geometry.
+        Skips the (expensive) GEOS union whenever the result is known upfront.
+        """
+        if len(geoms) == 1:
+            return geoms[0]
+
+        geom_types = set(shapely.get_type_id(geoms))
+        if geom_types == {shapely.GeometryType.POINT}:
+            return shapely.multipoints(geoms)
+
+        # Polygons whose bounding boxes never meet cannot overlap, so the union
+        # is just the collection of their parts.
+        polygon_types = {shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON}
+        if geom_types <= polygon_types:
+            tree = shapely.STRtree(geoms)
+            pairs = tree.query(geoms)
+            if pairs.shape[1] == len(geoms):  # each geometry only hits itself
+                return shapely.multipolygons(shapely.get_parts(geoms))
+
+        # shapely.union_all runs GEOS' cascaded union over the whole array in
+        # one call, which is much faster than unioning one giant list.
+        return shapely.union_all(geoms)
+
+    def load_gadm(self, name: str, admin_level: int = 0) -> gpd.GeoDataFrame:
+        """
+        GADM boundaries for a country at an admin level. This is the app's single
+        GADM cache (in memory and as GeoParquet under cache_folder); treat the
+        returned GeoDataFrame as read-only.
+        """
+        return _load_gadm_items(name, admin_level, str(self.cache_folder))
+
     def _parse_gadm(self, data: dict) -> ee.Geometry:
         """
         Retrieves geometry using pygadm.
         data expected keys: 'country', 'admin_level', 'region'
         """
+        import ee
+
         try:
-            # Example usage of pygadm (pseudocode as specific API might vary)
-            # pygadm.get_items(name=country, content_level=1)
-            # This requires knowing the exact library usage. 
             # Assuming data contains 'name' e.g., 'Italy', and 'admin_level' e.g., 1
-            
             name = data.get('name')
             admin_level = data.get('admin_level', 0)
             
-            gdf = pygadm.get_items(name=name, content_level=admin_level)
+            gdf = self.load_gadm(name, admin_level)
             
             if gdf.empty:
                 raise ValueError(f"No GADM data found for {name} at level {admin_level}")
                 
+            geoms = gdf.geometry.values
+            if self.simplify_tolerance > 0:
+                geoms = shapely.simplify(geoms, self.simplify_tolerance, preserve_topology=True)
+
             # Convert to ee.Geometry similar to shapefile
-            geojson_str = gdf.to_json()
-            geojson_dict = json.loads(geojson_str)
+            geojson_dict = self._to_geojson_dict(geoms)
             fc = ee.FeatureCollection(geojson_dict)
             return fc.geometry()
             
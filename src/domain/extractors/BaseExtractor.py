@@ -1,23 +1,118 @@
 from abc import ABC, abstractmethod
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import ee
 from src.infrastructure.configuration.SettingsService import SettingsService
-from src.application.services.GeometryService import GeometryService
+from src.application.services.GeometryService import GeometryService, DEFAULT_SIMPLIFY_TOLERANCE
+
+# ee.Initialize is abandoned after this long so a slow network cannot freeze the UI
+EE_INIT_TIMEOUT_SECONDS = 5
+
+# Future of the last timed initialization; while a timed-out one is still running,
+# no new one is started (it could otherwise finish later and clobber the ee state)
+_pending_init = None
+
+# High-volume endpoint for synchronous getInfo() fan-out (batch exports keep the default one)
+HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+
+# (project_id, opt_url) that ee.Initialize last succeeded with. The ee client is
+# process-global, so every initialization goes through initialize_ee to keep this true.
+# The lock is re-entrant so ee_session can hold it across nested initialize_ee calls.
+_active_ee_session = None
+_ee_session_lock = threading.RLock()
+
+# Substrings of EEException messages that mean "credentials missing/invalid"
+_AUTH_ERROR_HINTS = ("credentials", "oauth", "not authenticated", "authenticate")
+
+# Short-lived cache of ee.data.getTaskList(), shared by all pollers
+TASK_LIST_TTL_SECONDS = 5
+_task_list_cache = (0.0, [])  # (fetched_at, tasks)
+_task_list_lock = threading.Lock()
+
+def initialize_ee(project_id: str, opt_url: str = None, force: bool = False):
+    """
+    Points the process-wide ee client at project_id and opt_url (None = standard endpoint).
+    Skipped when it is already initialized that way, unless force (e.g. new credentials).
+    """
+    global _active_ee_session
+    with _ee_session_lock:
+        if force or _active_ee_session != (project_id, opt_url):
+            _active_ee_session = None  # unknown until this call succeeds
+            ee.Initialize(project=project_id, opt_url=opt_url)
+            _active_ee_session = (project_id, opt_url)
+
+
+@contextmanager
+def ee_session(project_id: str, opt_url: str = None):
+    """
+    Runs the block with the ee client on project_id and opt_url, holding _ee_session_lock.
+
+    Any other initialize_ee call, ee_session block or task-list poll waits until the
+    block ends, so nothing else can switch the endpoint under it. With opt_url set
+    (the high-volume endpoint) the standard endpoint is restored on exit. This means
+    high-volume downloads are serialized process-wide, and other sessions' Drive
+    exports queue behind them instead of running on the high-volume endpoint.
+    """
+    with _ee_session_lock:
+        initialize_ee(project_id, opt_url)
+        try:
+            yield
+        finally:
+            if opt_url:
+                # Back to the standard endpoint for exports and task polling
+                try:
+                    initialize_ee(project_id)
+                except Exception as e:
+                    print(f"Could not restore the standard GEE endpoint: {e}")
+
 
 class BaseExtractor(ABC):
-    def __init__(self, project_id: str):
+    def __init__(self, project_id: str, settings_service: SettingsService = None):
         self.project_id = project_id
         self._authenticate()
-        self.settings_service = SettingsService()
-        self.geometry_service = GeometryService()
+        # Reuse the caller's (cached) service instead of re-reading settings.toml
+        self.settings_service = settings_service or SettingsService()
+        self.geometry_service = GeometryService(
+            cache_folder=self.settings_service.get_setting("paths", "cache_folder", "./.cache/"),
+            simplify_tolerance=self.settings_service.get_setting("defaults", "simplify_tolerance", DEFAULT_SIMPLIFY_TOLERANCE),
+        )
 
     def _authenticate(self):
-        """Authenticates with Earth Engine."""
+        """Authenticates with Earth Engine (once per project and process)."""
+        if _active_ee_session == (self.project_id, None):
+            return
         try:
-            ee.Initialize(project=self.project_id)
-        except Exception:
-            # Trigger auth flow if initialization fails
+            self._initialize()
+        except ee.EEException as e:
+            # Only a credentials problem warrants the interactive (browser) auth flow;
+            # transient or configuration errors (e.g. wrong project) are re-raised.
+            if not any(hint in str(e).lower() for hint in _AUTH_ERROR_HINTS):
+                raise
             ee.Authenticate()
-            ee.Initialize(project=self.project_id)
+            self._initialize()
+
+    def _initialize(self):
+        """Runs initialize_ee with a timeout of EE_INIT_TIMEOUT_SECONDS."""
+        global _pending_init
+        if _pending_init is not None and not _pending_init.done():
+            raise TimeoutError(
+                "A previous Earth Engine initialization is still running; try again shortly"
+            )
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            # initialize_ee updates the session tracker together with the ee state,
+            # so a call that completes after the timeout still leaves both consistent
+            _pending_init = executor.submit(initialize_ee, self.project_id)
+            _pending_init.result(timeout=EE_INIT_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            raise TimeoutError(
+                f"Earth Engine initialization timed out after {EE_INIT_TIMEOUT_SECONDS}s"
+            )
+        finally:
+            # Don't wait for a hung call; the worker thread finishes on its own
+            executor.shutdown(wait=False)
 
     def load_settings(self):
         """Refreshes settings from service."""
@@ -43,10 +138,26 @@ class BaseExtractor(ABC):
         return self.geometry_service.parse_geometry(data, geometry_type)
 
     @staticmethod
-    def monitor_tasks(limit=20):
-        """Returns list of recent GEE tasks."""
+    def monitor_tasks(limit=20, raise_errors=False):
+        """Returns list of recent GEE tasks (cached for TASK_LIST_TTL_SECONDS).
+
+        Failures are never cached. By default they are logged and an empty
+        list is returned; with raise_errors=True they propagate so callers
+        can tell "no tasks" apart from "could not fetch tasks".
+        """
+        global _task_list_cache
         try:
-            return ee.data.getTaskList()[:limit]
+            # The lock coalesces concurrent pollers into a single HTTP call
+            with _task_list_lock:
+                fetched_at, tasks = _task_list_cache
+                if time.monotonic() - fetched_at >= TASK_LIST_TTL_SECONDS:
+                    # Not while a high-volume ee_session has the endpoint switched
+                    with _ee_session_lock:
+                        tasks = ee.data.getTaskList()
+                    _task_list_cache = (time.monotonic(), tasks)
+            return tasks[:limit]
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error fetching task list: {e}")
             return []
@@ -1,7 +1,12 @@
-import toml
+import copy
 import os
 from pathlib import Path
 
+from src.infrastructure.utils.fs_utils import ensure_dir
+
+# Parsed settings shared by every instance: {resolved path: (st_mtime_ns, settings)}
+_PARSED_SETTINGS: dict = {}
+
 class SettingsService:
     def __init__(self, config_path: str = "config/settings.toml"):
         self.config_path = Path(config_path)
@@ -18,11 +23,31 @@ class SettingsService:
                 return {}
         
         try:
-            return toml.load(self.config_path)
+            stat = os.stat(self.config_path)
+            if stat.st_size == 0:
+                return {}
+
+            # Reuse the parse of an unchanged file (each instance gets its own copy)
+            cache_key = str(self.config_path.resolve())
+            cached = _PARSED_SETTINGS.get(cache_key)
+            if cached is None or cached[0] != stat.st_mtime_ns:
+                cached = (stat.st_mtime_ns, self._parse_toml())
+                _PARSED_SETTINGS[cache_key] = cached
+            return copy.deepcopy(cached[1])
         except Exception as e:
             print(f"Error loading settings: {e}")
             return {}
 
+    def _parse_toml(self) -> dict:
+        """Parses the TOML file; stdlib tomllib (3.11+) is preferred, imported lazily."""
+        try:
+            import tomllib
+        except ImportError:
+            import toml
+            return toml.load(self.config_path)
+        with open(self.config_path, "rb") as f:
+            return tomllib.load(f)
+
     def get_setting(self, section: str, key: str, default=None):
         """Retrieves a specific setting value."""
         return self._settings.get(section, {}).get(key, default)
@@ -41,6 +66,13 @@ class SettingsService:
 
     def _save_settings(self):
         """Writes the current settings back to the TOML file."""
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            toml.dump(self._settings, f)
+        ensure_dir(self.config_path.parent)
+        try:
+            import tomli_w
+        except ImportError:
+            import toml
+            with open(self.config_path, "w") as f:
+                toml.dump(self._settings, f)
+            return
+        with open(self.config_path, "wb") as f:
+            tomli_w.dump(self._settings, f)
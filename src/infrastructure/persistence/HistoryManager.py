@@ -1,48 +1,113 @@
-import json
+import copy
 import os
+from collections import deque
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
+from src.infrastructure.utils import json_utils
+from src.infrastructure.utils.fs_utils import ensure_dir
+
+# Default number of (most recent) entries kept in memory
+MAX_HISTORY_ENTRIES = 500
+
+# history.jsonl is rewritten with only the kept entries once it holds more
+# than this many times max_entries lines (it otherwise only grows by appends)
+COMPACT_FACTOR = 2
+
 class HistoryManager:
-    def __init__(self, cache_folder: str = "./.cache/"):
+    def __init__(self, cache_folder: str = "./.cache/", max_entries: int = MAX_HISTORY_ENTRIES):
         self.cache_folder = Path(cache_folder)
-        self.history_file = self.cache_folder / "history.json"
-        
+        self.max_entries = max_entries
+        # History is stored as JSON Lines (oldest first) so new entries are a single append
+        self.history_file = self.cache_folder / "history.jsonl"
+        self.legacy_history_file = self.cache_folder / "history.json"
+
         # Ensure cache directory exists
-        self.cache_folder.mkdir(parents=True, exist_ok=True)
-        
-        self._history = self._load_history()
+        ensure_dir(self.cache_folder)
+
+        # Newest first; the oldest entries fall off once max_entries is reached
+        self._history = deque(self._load_history(), maxlen=self.max_entries)
 
     def _load_history(self) -> list:
-        """Loads history from JSON file."""
+        """Loads history from the JSON Lines file, newest first."""
         if not self.history_file.exists():
+            return self._migrate_legacy_history()
+
+        try:
+            with open(self.history_file, "rb") as f:
+                # Only the tail of the file is kept (and parsed)
+                lines = deque(maxlen=self.max_entries)
+                n_lines = 0
+                for line in f:
+                    lines.append(line)
+                    n_lines += 1
+        except IOError as e:
+            print(f"Error loading history: {e}")
+            return []
+
+        history = []
+        for line in reversed(lines):
+            if not line.strip():
+                continue
+            try:
+                history.append(json_utils.loads(line))
+            except json_utils.JSONDecodeError as e:
+                print(f"Skipping corrupt history entry: {e}")
+
+        if n_lines > COMPACT_FACTOR * self.max_entries:
+            # Drop the entries that no longer fit so later startups read a short file
+            self._history = history
+            self._save_history()
+        return history
+
+    def _migrate_legacy_history(self) -> list:
+        """One-shot conversion of the old history.json (newest first list) to JSON Lines."""
+        if not self.legacy_history_file.exists():
             return []
-        
+
         try:
-            with open(self.history_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            with open(self.legacy_history_file, "rb") as f:
+                history = json_utils.loads(f.read())
+        except (json_utils.JSONDecodeError, IOError) as e:
             print(f"Error loading history: {e}")
             return []
 
+        self._history = history
+        if self._save_history():
+            os.remove(self.legacy_history_file)
+        return history[:self.max_entries]
+
     def add_entry(self, entry: dict):
         """Adds a new entry to the history."""
+        # The history is shared by every session (see get_history_manager), so store
+        # a private copy: the caller's lists (e.g. selected_points) keep being mutated
+        entry = copy.deepcopy(entry)
         # Add metadata
-        entry["timestamp"] = datetime.now().isoformat()
-        entry["job_id"] = str(uuid.uuid4())
-        
-        self._history.insert(0, entry) # Prepend to keep newest first
-        self._save_history()
-
-    def get_history(self) -> list:
-        """Returns the full history list."""
+        entry["timestamp"] = datetime.now(timezone.utc).isoformat()
+        entry["job_id"] = uuid.uuid4().hex
+
+        self._history.appendleft(entry) # Prepend to keep newest first
+        try:
+            with open(self.history_file, "ab") as f:
+                f.write(json_utils.dumps(entry) + b"\n")
+        except IOError as e:
+            print(f"Error saving history: {e}")
+
+    def get_history(self) -> deque:
+        """Returns the in-memory history, newest first."""
         return self._history
 
-    def _save_history(self):
-        """Attributes persistent storage."""
+    def _save_history(self) -> bool:
+        """Rewrites the whole history file (oldest first). Returns True on success."""
+        # Write a temporary file and swap it in, so a crash never leaves a truncated history
+        tmp_file = self.history_file.with_suffix(".jsonl.tmp")
         try:
-            with open(self.history_file, "w") as f:
-                json.dump(self._history, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                for entry in reversed(self._history):
+                    f.write(json_utils.dumps(entry) + b"\n")
+            os.replace(tmp_file, self.history_file)
+            return True
         except IOError as e:
             print(f"Error saving history: {e}")
+            return False
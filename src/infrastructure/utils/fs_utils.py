@@ -0,0 +1,16 @@
+"""
+Filesystem helpers shared by the persistence/configuration services.
+"""
+from pathlib import Path
+
+# Directories already created (or found) during this process
+_ENSURED_DIRS: set = set()
+
+
+def ensure_dir(path) -> Path:
+    """Create a directory (and parents) once per process; later calls are free."""
+    path = Path(path)
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
@@ -0,0 +1,29 @@
+"""
+JSON helpers — use orjson when it is installed, the stdlib json module otherwise.
+
+Both helpers work with bytes so callers can read/write files in binary mode
+regardless of which backend is active.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+# Raised by loads() on malformed input (orjson's error subclasses this one)
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads(data):
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -16,11 +16,17 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+@st.cache_resource
+def get_settings_service() -> SettingsService:
+    """Shared SettingsService, so settings.toml is not re-parsed on every rerun."""
+    return SettingsService()
+
+
 def main():
     """Main application loop."""
     
     # Initialize Services
-    settings_service = SettingsService()
+    settings_service = get_settings_service()
 
     # Check for updates once per session (not on every Streamlit rerun)
     if 'update_info' not in st.session_state:
@@ -1,6 +1,7 @@
 """
 Main Panel module for the GEE Data Extractor.
-Contains the primary extraction pipeline UI with 4 sections:
+Contains the primary extraction pipeline UI with 4 sections, shown as tabs.
+Each is rendered as an st.fragment so a widget change only reruns its own section:
 1. Data Source (WHAT) - Satellite and variable selection
 2. Region of Interest (WHERE) - Point/Shapefile/GADM selection
 3. Time Definition (WHEN) - Year and DOY selection
@@ -8,37 +9,112 @@ Contains the primary extraction pipeline UI with 4 sections:
 """
 import streamlit as st
 import ee
+import importlib.util
+import io
 import json
+import numpy as np
+import shapely
 from pathlib import Path
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from functools import partial
+from itertools import repeat
+
+# Imported once at script load
+import pandas as pd
+import pyarrow as pa
+
+# pygadm is optional (GADM section shows a hint). Only probe for it here:
+# importing it is slow and GeometryService imports it lazily when needed.
+_HAS_PYGADM = importlib.util.find_spec("pygadm") is not None
 
 from src.infrastructure.configuration.SettingsService import SettingsService
-from src.application.services.GeometryService import GeometryService
-from src.infrastructure.persistence.HistoryManager import HistoryManager
+from src.application.services.GeometryService import GeometryService, DEFAULT_SIMPLIFY_TOLERANCE
+from src.infrastructure.utils import json_utils
+from src.domain.extractors.BaseExtractor import HIGH_VOLUME_URL, ee_session, initialize_ee
 from src.interface.map_utils import (
     create_base_map, add_geojson_overlay, add_markers, render_map,
-    render_map_display, gdf_to_geojson, extract_gadm_display_columns,
-    fetch_gadm_boundaries,
+    render_map_display, gdf_to_geojson, gdf_to_display_geojson,
+    extract_gadm_display_columns,
 )
+from src.interface.sidebar import get_history_manager
 from src.infrastructure.utils.maps_url_parser import (
     parse_google_maps_url, is_google_maps_url,
 )
 
 
-def load_satellites():
-    """Load satellite configurations from JSON."""
+# Upper bound for year inputs (evaluated once at import; restart the app after New Year)
+_CURRENT_YEAR = datetime.now().year
+
+# Accepted (lower-case) column names for point coordinates in uploaded CSVs
+LAT_COLUMN_ALIASES = frozenset({'lat', 'latitude', 'y', 'lat_dec'})
+LON_COLUMN_ALIASES = frozenset({'lon', 'longitude', 'x', 'lon_dec', 'lng'})
+
+# Points per request on the local-download path, and how many run at once
+FETCH_CHUNK_SIZE = 200
+FETCH_MAX_WORKERS = 8
+
+# Features per ee.data.computeFeatures page
+COMPUTE_FEATURES_PAGE_SIZE = 1000
+
+# Local-download output format (also the file extension) -> MIME type
+OUTPUT_MIME_TYPES = {
+    'csv': 'text/csv',
+    'feather': 'application/octet-stream',
+    'parquet': 'application/octet-stream',
+}
+
+# Reducer name (as offered in the UI) -> ee.Reducer factory
+REDUCER_FACTORIES = {
+    'mean': ee.Reducer.mean,
+    'sum': ee.Reducer.sum,
+    'max': ee.Reducer.max,
+    'min': ee.Reducer.min,
+    'median': ee.Reducer.median,
+    'first': ee.Reducer.first,
+}
+
+
+def _satellites_config_key():
+    """Return (resolved path, mtime_ns) of the satellites JSON, or None if missing."""
     # Try config folder first, then root
     config_path = Path("config/satellites.json")
     if not config_path.exists():
         config_path = Path("satellites.json")
     
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            data = json.load(f)
-            return data.get('satellites', [])
-    return []
+        return str(config_path.resolve()), config_path.stat().st_mtime_ns
+    return None
+
+
+def load_satellites():
+    """Load satellite configurations from JSON (parsed once, until the file changes)."""
+    config_key = _satellites_config_key()
+    return _read_satellites(*config_key) if config_key else ()
+
+
+def load_satellite_index():
+    """Return ({name: satellite}, {id: satellite}) lookup dicts."""
+    config_key = _satellites_config_key()
+    return _index_satellites(*config_key) if config_key else ({}, {})
+
+
+@st.cache_data(show_spinner=False)
+def _read_satellites(config_path: str, mtime_ns: int) -> tuple:
+    """Parse satellites.json; mtime_ns is only part of the cache key."""
+    with open(config_path, 'rb') as f:
+        data = json_utils.loads(f.read())
+    return tuple(data.get('satellites', []))
+
+
+@st.cache_data(show_spinner=False)
+def _index_satellites(config_path: str, mtime_ns: int) -> tuple:
+    """Build the name/id lookups once per satellites.json version."""
+    satellites = _read_satellites(config_path, mtime_ns)
+    return {s['name']: s for s in satellites}, {s['id']: s for s in satellites}
 
 
 def update_default_filename():
@@ -46,13 +122,13 @@ def update_default_filename():
     # Get current satellite ID
     # Note: satellite_selector key in session state holds the name
     sat_name = st.session_state.get('satellite_selector')
-    satellites = load_satellites()
-    selected_satellite = next((s for s in satellites if s['name'] == sat_name), None)
+    name_to_sat, _ = load_satellite_index()
+    selected_satellite = name_to_sat.get(sat_name)
     sat_id = selected_satellite['id'] if selected_satellite else "GEE"
     
     # Get current years (prefer form values if in middle of submission, else session state)
     start = st.session_state.get('form_start_year') or st.session_state.get('start_year', 2020)
-    end = st.session_state.get('form_end_year') or st.session_state.get('end_year', datetime.now().year)
+    end = st.session_state.get('form_end_year') or st.session_state.get('end_year', _CURRENT_YEAR)
     
     st.session_state.custom_filename = f"{sat_id}_{start}_{end}_timeseries"
 
@@ -68,23 +144,21 @@ def apply_loaded_settings():
     # 1. Restore Satellite
     # We need to map ID (saved) to Name (widget key)
     if loaded.get('satellite'):
-        sat_id = loaded['satellite']
-        satellites = load_satellites()
-        sat_name = next((s['name'] for s in satellites if s['id'] == sat_id), None)
-        if sat_name:
-            st.session_state.satellite_selector = sat_name
+        _, id_to_sat = load_satellite_index()
+        satellite = id_to_sat.get(loaded['satellite'])
+        if satellite:
+            st.session_state.satellite_selector = satellite['name']
 
     # 2. Restore Bands
     if loaded.get('bands'):
         st.session_state.band_multiselect = loaded['bands']
+        st.session_state.selected_bands = loaded['bands']
 
     # 3. Restore Reducers (Band Selections)
     # Saved as {'band': 'reducer'} in 'reducers' key
     if loaded.get('reducers'):
+        # The reducer table is seeded from band_selections
         st.session_state.band_selections = loaded['reducers']
-        # Also set the widget keys for each reducer
-        for band, reducer in loaded['reducers'].items():
-            st.session_state[f"reducer_{band}"] = reducer
 
     # 4. Restore ROI (Points, Shapefile, GADM)
     geo_source = loaded.get('geometry_source')
@@ -97,6 +171,7 @@ def apply_loaded_settings():
 
     if loaded.get('selected_points'):
         st.session_state.selected_points = loaded['selected_points']
+        st.session_state.pop('selected_point_keys', None)  # rebuilt on next access
     
     shapefile_path = loaded.get('uploaded_shapefile')
     if shapefile_path:
@@ -189,26 +264,31 @@ def render(settings_service: SettingsService):
     # Initialize session state for points if not exists
     if 'selected_points' not in st.session_state:
         st.session_state.selected_points = []
+        st.session_state.selected_point_keys = set()
     
-    # Section 1: Data Source (WHAT)
-    render_data_source_section(satellites, loaded_settings)
+    # One tab per section: only the active one is visible in the browser
+    tab_data, tab_roi, tab_time, tab_exec = st.tabs(
+        ["1️⃣ Data Source", "2️⃣ Region of Interest", "3️⃣ Time Definition", "4️⃣ Execution"]
+    )
     
-    st.divider()
+    # Section 1: Data Source (WHAT)
+    with tab_data:
+        render_data_source_section(satellites, loaded_settings)
     
     # Section 2: Region of Interest (WHERE)
-    render_roi_section(loaded_settings)
-    
-    st.divider()
+    with tab_roi:
+        render_roi_section(settings_service, loaded_settings)
     
     # Section 3: Time Definition (WHEN)
-    render_time_section(loaded_settings)
-    
-    st.divider()
+    with tab_time:
+        render_time_section(loaded_settings)
     
     # Section 4: Execution (HOW)
-    render_execution_section(settings_service, satellites)
+    with tab_exec:
+        render_execution_section(settings_service, satellites)
 
 
+@st.fragment
 def render_data_source_section(satellites: list, loaded_settings: dict):
     """Section 1: Data Source - Satellite and variable selection."""
     st.header("1️⃣ Data Source")
@@ -218,16 +298,14 @@ def render_data_source_section(satellites: list, loaded_settings: dict):
         return
     
     # Build satellite options
-    satellite_options = {sat['name']: sat for sat in satellites}
+    satellite_options, id_to_sat = load_satellite_index()
     satellite_names = list(satellite_options.keys())
     
     # Default selection from loaded settings or settings
     default_idx = 0
-    if loaded_settings.get('satellite'):
-        for i, name in enumerate(satellite_names):
-            if satellite_options[name]['id'] == loaded_settings.get('satellite'):
-                default_idx = i
-                break
+    loaded_id = loaded_settings.get('satellite')
+    if loaded_id in id_to_sat:
+        default_idx = satellite_names.index(id_to_sat[loaded_id]['name'])
     
     # Satellite selector
     selected_sat_name = st.selectbox(
@@ -268,6 +346,8 @@ def render_data_source_section(satellites: list, loaded_settings: dict):
         default_bands = loaded_settings.get('bands', [])
         default_selections = [b for b in band_names if b in default_bands] or band_names[:1]
         
+        # Band choice is applied at once (it only reruns this fragment) so the
+        # reducer table below always has one row per selected band
         selected_bands = st.multiselect(
             "Select bands to extract",
             options=band_names,
@@ -275,6 +355,11 @@ def render_data_source_section(satellites: list, loaded_settings: dict):
             key="band_multiselect"
         )
         
+        previous_satellite = st.session_state.get('selected_satellite')
+        satellite_changed = bool(previous_satellite) and previous_satellite['id'] != selected_satellite['id']
+        st.session_state.selected_satellite = selected_satellite
+        st.session_state.selected_bands = selected_bands
+        
         # For each selected band, show reducer option
         if selected_bands:
             st.markdown(
@@ -283,32 +368,48 @@ def render_data_source_section(satellites: list, loaded_settings: dict):
                 "pixel values within the shape, &quot;max&quot; takes the highest value, etc."
             )
             reducers = ['mean', 'sum', 'max', 'min', 'median', 'first']
+            bands_by_name = {b['name']: b for b in bands}
             
-            for band_name in selected_bands:
-                col1, col2 = st.columns([2, 1])
-                with col1:
-                    # Find band info
-                    band_info = next((b for b in bands if b['name'] == band_name), {})
-                    units = band_info.get('units', '')
-                    desc = band_info.get('description', '')
-                    st.caption(f"**{band_name}** ({units}) - {desc[:50]}...")
-                with col2:
-                    reducer = st.selectbox(
-                        f"Reducer",
-                        options=reducers,
-                        index=0,
-                        key=f"reducer_{band_name}",
-                        label_visibility="collapsed"
-                    )
-                    st.session_state.band_selections[band_name] = reducer
+            # One editable table instead of a caption + selectbox pair per band
+            band_info = [bands_by_name.get(b, {}) for b in selected_bands]
+            reducer_df = pd.DataFrame({
+                'band': selected_bands,
+                'units': [info.get('units', '') for info in band_info],
+                'description': [info.get('description', '') for info in band_info],
+                'reducer': [st.session_state.band_selections.get(b, reducers[0]) for b in selected_bands],
+            })
+            
+            # Batch reducer edits in a form: the page reruns once, on Apply
+            with st.form("bands_form"):
+                edited_df = st.data_editor(
+                    reducer_df,
+                    column_config={
+                        'band': "Band",
+                        'units': "Units",
+                        'description': "Description",
+                        'reducer': st.column_config.SelectboxColumn("Reducer", options=reducers, required=True),
+                    },
+                    disabled=['band', 'units', 'description'],
+                    hide_index=True,
+                    use_container_width=True,
+                    # Row edits are stored by position: start fresh when the bands change
+                    key=f"reducer_editor_{'|'.join(selected_bands)}"
+                )
+                submitted = st.form_submit_button("✅ Apply Reducers", use_container_width=True)
+            
+            if submitted:
+                st.session_state.band_selections = dict(zip(edited_df['band'], edited_df['reducer']))
         
-        st.session_state.selected_satellite = selected_satellite
-        st.session_state.selected_bands = selected_bands
+        # This section runs as a fragment, but the time range and filename in the
+        # other sections depend on the dataset: rerun the whole page when it changes
+        if satellite_changed:
+            st.rerun()
     else:
         st.warning("No bands available for this dataset")
 
 
-def render_roi_section(loaded_settings: dict):
+@st.fragment
+def render_roi_section(settings_service: SettingsService, loaded_settings: dict):
     """Section 2: Region of Interest - Geometry selection."""
     st.header("2️⃣ Region of Interest")
     
@@ -320,19 +421,18 @@ def render_roi_section(loaded_settings: dict):
         key="roi_method"
     )
     
-    geometry_service = GeometryService()
-    
     if "📍 Point" in roi_method:
         render_point_input(loaded_settings)
     elif "📁 File" in roi_method:
-        render_shapefile_input()
+        render_shapefile_input(settings_service)
     elif "🗺️ GADM" in roi_method:
-        render_gadm_input()
+        render_gadm_input(settings_service)
     
     # Display map for verification
     render_verification_map()
 
 
+@st.fragment
 def render_point_input(loaded_settings: dict):
     """Point coordinate input with multiple points support."""
     st.subheader("Point Selection")
@@ -349,9 +449,7 @@ def render_point_input(loaded_settings: dict):
         st.write("")
         if st.button("➕ Add", key="add_point_btn"):
             if lat != 0.0 or lon != 0.0:
-                point = {'lat': lat, 'lon': lon}
-                if point not in st.session_state.selected_points:
-                    st.session_state.selected_points.append(point)
+                if _add_point(lat, lon):
                     st.success(f"Added point ({lat}, {lon})")
                     st.rerun()
 
@@ -377,9 +475,7 @@ def render_point_input(loaded_settings: dict):
                     coords = parse_google_maps_url(gmaps_url)
                 if coords:
                     lat, lon = round(coords[0], 6), round(coords[1], 6)
-                    point = {'lat': lat, 'lon': lon}
-                    if point not in st.session_state.selected_points:
-                        st.session_state.selected_points.append(point)
+                    if _add_point(lat, lon):
                         st.success(f"✅ Added point ({lat}, {lon})")
                         st.rerun()
                     else:
@@ -399,28 +495,23 @@ def render_point_input(loaded_settings: dict):
         csv_file = st.file_uploader("Upload CSV file", type=['csv'], key="point_csv_uploader", help="CSV must contain 'lat' and 'lon' columns (or 'latitude'/'longitude')")
         if csv_file:
             try:
-                import pandas as pd
                 df = pd.read_csv(csv_file)
                 
-                # Detect columns
-                lat_cols = [c for c in df.columns if c.lower() in ['lat', 'latitude', 'y', 'lat_dec']]
-                lon_cols = [c for c in df.columns if c.lower() in ['lon', 'longitude', 'x', 'lon_dec', 'lng']]
+                # Detect columns (first match wins)
+                lat_col = next((c for c in df.columns if c.lower() in LAT_COLUMN_ALIASES), None)
+                lon_col = next((c for c in df.columns if c.lower() in LON_COLUMN_ALIASES), None)
                 
-                if not lat_cols or not lon_cols:
+                if lat_col is None or lon_col is None:
                     st.error("❌ Could not find latitude/longitude columns. Please ensure they are named 'lat' and 'lon'.")
                 else:
-                    lat_col = lat_cols[0]
-                    lon_col = lon_cols[0]
+                    # Vectorized float conversion + rounding; rows with missing values are dropped
+                    coords = np.round(df[[lat_col, lon_col]].to_numpy(dtype=np.float64), 6)
+                    coords = coords[np.isfinite(coords).all(axis=1)]
                     
-                    new_points = []
-                    for _, row in df.iterrows():
-                        p = {'lat': round(float(row[lat_col]), 6), 'lon': round(float(row[lon_col]), 6)}
-                        if p not in st.session_state.selected_points and p not in new_points:
-                            new_points.append(p)
+                    n_added = sum(_add_point(p_lat, p_lon) for p_lat, p_lon in coords.tolist())
                     
-                    if new_points:
-                        st.session_state.selected_points.extend(new_points)
-                        st.success(f"✅ Added {len(new_points)} points from CSV!")
+                    if n_added:
+                        st.success(f"✅ Added {n_added} points from CSV!")
                         st.rerun()
                     else:
                         st.info("No new unique points found in CSV.")
@@ -431,44 +522,85 @@ def render_point_input(loaded_settings: dict):
     # Interactive map for clicking
     st.markdown("**Or click on map to add points:**")
     
-    # Create folium map
-    center = [0, 0]
-    if st.session_state.selected_points:
-        center = [st.session_state.selected_points[-1]['lat'], 
-                  st.session_state.selected_points[-1]['lon']]
-    
-    m = create_base_map(center=center, zoom=3)
+    # Create folium map (reused across reruns while the points are unchanged)
+    points_hash = hash(tuple((p['lat'], p['lon']) for p in st.session_state.selected_points))
+    if st.session_state.get('_point_map_hash') != points_hash:
+        center = [0, 0]
+        if st.session_state.selected_points:
+            center = [st.session_state.selected_points[-1]['lat'], 
+                      st.session_state.selected_points[-1]['lon']]
+        
+        m = create_base_map(center=center, zoom=3)
 
-    # Add existing points to map
-    add_markers(m, st.session_state.selected_points, color='red')
+        # Add existing points to map
+        add_markers(m, st.session_state.selected_points, color='red')
+        
+        st.session_state._point_map = m
+        st.session_state._point_map_hash = points_hash
+    m = st.session_state._point_map
 
     map_data = render_map(m, key="point_map")
     
     # Handle map click
     if map_data and map_data.get('last_clicked'):
         clicked = map_data['last_clicked']
-        new_point = {'lat': round(clicked['lat'], 6), 'lon': round(clicked['lng'], 6)}
-        if new_point not in st.session_state.selected_points:
-            st.session_state.selected_points.append(new_point)
+        if _add_point(round(clicked['lat'], 6), round(clicked['lng'], 6)):
             st.rerun()
     
-    # Display selected points with delete option
+    # Display selected points as one editable table (select rows + Delete to remove)
     if st.session_state.selected_points:
         st.markdown("**Selected Points:**")
-        for i, pt in enumerate(st.session_state.selected_points):
-            col1, col2 = st.columns([4, 1])
-            with col1:
-                st.text(f"Point {i+1}: ({pt['lat']}, {pt['lon']})")
-            with col2:
-                if st.button("🗑️", key=f"del_pt_{i}"):
-                    st.session_state.selected_points.pop(i)
-                    st.rerun()
+        points_df = pd.DataFrame(st.session_state.selected_points, columns=['lat', 'lon'])
+        # Versioned key: a fresh editor (without stale edits) after each applied change
+        editor_version = st.session_state.get('_points_editor_version', 0)
+        edited_df = st.data_editor(
+            points_df,
+            num_rows="dynamic",
+            column_config={
+                'lat': st.column_config.NumberColumn("Latitude", min_value=-90.0, max_value=90.0, format="%.6f"),
+                'lon': st.column_config.NumberColumn("Longitude", min_value=-180.0, max_value=180.0, format="%.6f"),
+            },
+            use_container_width=True,
+            key=f"points_editor_{editor_version}"
+        )
+        
+        # Incomplete rows are ignored and duplicates collapsed
+        edited_coords = edited_df[['lat', 'lon']].dropna().to_numpy(dtype=np.float64).tolist()
+        edited_points = [{'lat': p_lat, 'lon': p_lon}
+                         for p_lat, p_lon in dict.fromkeys(map(tuple, edited_coords))]
+        if edited_points != st.session_state.selected_points:
+            st.session_state.selected_points = edited_points
+            st.session_state.pop('selected_point_keys', None)  # rebuilt on next access
+            st.session_state._points_editor_version = editor_version + 1
+            st.rerun()
         
         if st.button("Clear All Points"):
             st.session_state.selected_points = []
+            st.session_state.selected_point_keys = set()
             st.rerun()
 
 
+def _point_keys() -> set:
+    """Set of (lat, lon) tuples mirroring selected_points, for O(1) duplicate checks."""
+    points = st.session_state.selected_points
+    keys = st.session_state.get('selected_point_keys')
+    if keys is None or len(keys) != len(points):
+        # Missing or out of sync (e.g. points restored from history): rebuild
+        keys = {(p['lat'], p['lon']) for p in points}
+        st.session_state.selected_point_keys = keys
+    return keys
+
+
+def _add_point(lat: float, lon: float) -> bool:
+    """Append a point to selected_points unless already present. Returns True if added."""
+    keys = _point_keys()
+    if (lat, lon) in keys:
+        return False
+    keys.add((lat, lon))
+    st.session_state.selected_points.append({'lat': lat, 'lon': lon})
+    return True
+
+
 def _open_file_dialog():
     """Open a native file dialog in a separate thread (tkinter requires this from Streamlit)."""
     import tkinter as tk
@@ -501,11 +633,11 @@ def _open_file_dialog():
     return result[0]
 
 
-def render_shapefile_input():
+def render_shapefile_input(settings_service: SettingsService):
     """File import: Shapefile, GeoJSON, KML with path selector and button-triggered map preview."""
     st.subheader("File Import")
     
-    geometry_service = GeometryService()
+    geometry_service = _geometry_service(settings_service)
     
     # --- Apply pending state changes BEFORE widget creation ---
     # (Streamlit allows setting widget keys before the widget is instantiated)
@@ -603,10 +735,11 @@ def render_shapefile_input():
             if import_path and os.path.exists(import_path):
                 try:
                     # Load file on-demand just for preview (simplified for rendering speed)
-                    gdf = geometry_service.load_file(import_path, simplify_tolerance=0.005)
+                    gdf = geometry_service.load_file(import_path)
                     
-                    centroid = gdf.geometry.unary_union.centroid
-                    center = [centroid.y, centroid.x]
+                    # Bounding-box midpoint: no need to union every geometry for a map center
+                    bounds = gdf.total_bounds
+                    center = [(bounds[1] + bounds[3]) / 2, (bounds[0] + bounds[2]) / 2]
                     m = create_base_map(center=center, zoom=5)
 
                     if geo_type == 'points':
@@ -623,19 +756,17 @@ def render_shapefile_input():
                         geojson_data = gdf_to_geojson(gdf)
                         add_geojson_overlay(m, geojson_data)
                     
-                    render_map_display(m, key="import_preview_map", fit_bounds=gdf.total_bounds)
+                    render_map_display(m, key="import_preview_map", fit_bounds=bounds)
                 except Exception as map_err:
                     st.warning(f"Map preview unavailable: {str(map_err)[:100]}")
 
 
-def render_gadm_input():
+def render_gadm_input(settings_service: SettingsService):
     """GADM administrative boundary selection with map visualization."""
     st.subheader("GADM Administrative Boundaries")
     
     # Check pygadm availability
-    try:
-        import pygadm  # noqa: F401 — availability check only
-    except ImportError:
+    if not _HAS_PYGADM:
         st.error("pygadm is not installed. Run: pip install pygadm")
         return
     
@@ -678,7 +809,7 @@ def render_gadm_input():
             # User explicitly requested a load — always proceed
             try:
                 with st.spinner(f"Loading {country} boundaries..."):
-                    gdf = fetch_gadm_boundaries(country, admin_level)
+                    gdf = _geometry_service(settings_service).load_gadm(country, admin_level)
                 
                 # Store in session state
                 st.session_state.gadm_gdf = gdf
@@ -713,6 +844,7 @@ def render_gadm_input():
                 
                 # If we have subdivisions, let user select specific ones
                 loaded_level = st.session_state.get('gadm_level_loaded', 0)
+                selected_regions = []
                 if loaded_level > 0 and len(gdf) > 1:
                     name_col = f"NAME_{loaded_level}"
                     if name_col in gdf.columns:
@@ -734,15 +866,17 @@ def render_gadm_input():
                 st.markdown("**Boundary Preview:**")
                 
                 try:
-                    # Get centroid for map center
-                    centroid = gdf.geometry.unary_union.centroid
-                    center = [centroid.y, centroid.x]
+                    # Map center from the bounding-box midpoint (no full union needed)
+                    bounds = gdf.total_bounds
+                    center = [(bounds[1] + bounds[3]) / 2, (bounds[0] + bounds[2]) / 2]
                     
                     # Create folium map with satellite base
                     m = create_base_map(center=center, zoom=5)
 
-                    # Convert to GeoJSON and detect display columns
-                    geojson_data = gdf_to_geojson(gdf)
+                    # Convert to (display-simplified) GeoJSON and detect display columns
+                    geojson_data = _gadm_display_geojson(
+                        loaded_country, loaded_level, tuple(selected_regions), gdf
+                    )
                     display_cols = extract_gadm_display_columns(geojson_data)
                     
                     # Build tooltip: use the most specific NAME column
@@ -765,7 +899,7 @@ def render_gadm_input():
                     )
                     
                     # Render map
-                    render_map_display(m, key="gadm_map", fit_bounds=gdf.total_bounds)
+                    render_map_display(m, key="gadm_map", fit_bounds=bounds)
                     
                 except Exception as map_error:
                     st.warning(f"Map preview unavailable: {str(map_error)[:100]}")
@@ -774,6 +908,7 @@ def render_gadm_input():
                 st.session_state.gadm_selection = {
                     'name': loaded_country,
                     'admin_level': loaded_level,
+                    'regions': tuple(selected_regions),
                     'gdf': gdf
                 }
                 
@@ -783,12 +918,19 @@ def render_gadm_input():
         st.caption("Enter a country name above to load its boundaries")
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def _gadm_display_geojson(country: str, admin_level: int, regions: tuple, _gdf) -> dict:
+    """Simplified GeoJSON for the GADM preview, cached per (country, level, regions)."""
+    return gdf_to_display_geojson(_gdf)
+
+
 def render_verification_map():
     """Passive verification map showing selected geometries."""
     # This is shown in the point input for now
     pass
 
 
+@st.fragment
 def render_time_section(loaded_settings: dict):
     """Section 3: Time Definition with form to reduce reruns."""
     st.header("3️⃣ Time Definition")
@@ -802,7 +944,7 @@ def render_time_section(loaded_settings: dict):
 
     # Check for invalid date ranges in session state
     current_start = st.session_state.get('start_year', 2020)
-    current_end = st.session_state.get('end_year', datetime.now().year)
+    current_end = st.session_state.get('end_year', _CURRENT_YEAR)
     
     if current_end < current_start:
         st.error(f"⚠️ **Invalid Date Range**: End Year ({current_end}) is before Start Year ({current_start}).")
@@ -822,7 +964,7 @@ def render_time_section(loaded_settings: dict):
             start_year = st.number_input(
                 "Start Year",
                 min_value=sat_min_year,
-                max_value=datetime.now().year,
+                max_value=_CURRENT_YEAR,
                 value=max(loaded_settings.get('dates', {}).get('start_year', 2020), sat_min_year),
                 key="form_start_year"
             )
@@ -831,8 +973,8 @@ def render_time_section(loaded_settings: dict):
             end_year = st.number_input(
                 "End Year",
                 min_value=sat_min_year,
-                max_value=datetime.now().year,
-                value=max(loaded_settings.get('dates', {}).get('end_year', datetime.now().year), sat_min_year),
+                max_value=_CURRENT_YEAR,
+                value=max(loaded_settings.get('dates', {}).get('end_year', _CURRENT_YEAR), sat_min_year),
                 key="form_end_year"
             )
         
@@ -891,13 +1033,14 @@ def render_time_section(loaded_settings: dict):
     if 'date_config' not in st.session_state:
         st.session_state.date_config = {
             'start_year': st.session_state.get('start_year', 2020),
-            'end_year': st.session_state.get('end_year', datetime.now().year),
+            'end_year': st.session_state.get('end_year', _CURRENT_YEAR),
             'start_doy': st.session_state.get('start_doy', 1),
             'end_doy': st.session_state.get('end_doy', 365),
             'use_season': st.session_state.get('use_season', False)
         }
 
 
+@st.fragment
 def render_execution_section(settings_service: SettingsService, satellites: list):
     """Section 4: Execution - Run extraction."""
     st.header("4️⃣ Execution")
@@ -961,16 +1104,20 @@ def run_extraction(settings_service: SettingsService, export_method: str):
                 st.error("Please define a region of interest (point, shapefile, or GADM)")
                 return
             
-            # Initialize GEE if needed
+            # Initialize GEE if needed (standard endpoint; a no-op once initialized)
             project_id = settings_service.get_setting("gee", "project_id")
+            # The high-volume endpoint only serves the synchronous (local download) path,
+            # and only inside an ee_session block; batch Drive exports stay on the standard one
+            use_highvolume = settings_service.get_setting("gee", "use_highvolume", False)
+            opt_url = HIGH_VOLUME_URL if use_highvolume and "Drive" not in export_method else None
             try:
-                ee.Initialize(project=project_id)
-            except:
-                st.error("Failed to initialize GEE. Please check authentication.")
+                initialize_ee(project_id)
+            except Exception as e:
+                st.error(f"Failed to initialize GEE. Please check authentication. ({e})")
                 return
             
             # Build geometry and feature collection
-            geometry, features = build_geometry_and_features()
+            geometry, features = build_geometry_and_features(settings_service)
             if geometry is None:
                 st.error("Failed to build geometry from inputs")
                 return
@@ -1004,41 +1151,35 @@ def run_extraction(settings_service: SettingsService, export_method: str):
             # Filter by bounds
             collection = collection.filterBounds(geometry)
             
-            # Select only needed bands
-            collection = collection.select(selected_bands)
+            # Group bands by their reducer so each reducer runs once over all its bands
+            bands_by_reducer = {}
+            for band in selected_bands:
+                bands_by_reducer.setdefault(band_selections.get(band, 'mean'), []).append(band)
             
-            # Build the reducer based on band selections
-            # We'll use the same reducer for all bands (most common case)
-            # or combine multiple reducers
-            reducer_name = list(band_selections.values())[0] if band_selections else 'mean'
-            
-            if reducer_name == 'mean':
-                reducer = ee.Reducer.mean()
-            elif reducer_name == 'sum':
-                reducer = ee.Reducer.sum()
-            elif reducer_name == 'max':
-                reducer = ee.Reducer.max()
-            elif reducer_name == 'min':
-                reducer = ee.Reducer.min()
-            elif reducer_name == 'median':
-                reducer = ee.Reducer.median()
-            elif reducer_name == 'first':
-                reducer = ee.Reducer.first()
-            else:
-                reducer = ee.Reducer.mean()
+            # Select only needed bands, ordered group by group to match the
+            # inputs of the combined reducer built below
+            collection = collection.select([b for group in bands_by_reducer.values() for b in group])
             
             # Detect whether the selected dataset has sub-daily (hourly) cadence
             is_hourly = selected_satellite.get('isHourly', False)
 
             # Function to extract data for each image
-            def extract_values(image):
-                """Extract values at each point/region for an image."""
+            def extract_values(image, fc):
+                """Extract values at each point/region of fc for an image."""
                 # Add date properties
                 date = ee.Date(image.get('system:time_start'))
                 
+                # One forEachBand reducer per group, combined into a single reducer;
+                # forEachBand names every output after its band.
+                reducer = None
+                for reducer_name, group in bands_by_reducer.items():
+                    group_reducer = REDUCER_FACTORIES.get(reducer_name, ee.Reducer.mean)()
+                    group_reducer = group_reducer.forEachBand(image.select(group))
+                    reducer = group_reducer if reducer is None else reducer.combine(group_reducer, sharedInputs=False)
+                
                 # Reduce regions - extract values at each feature
                 reduced = image.reduceRegions(
-                    collection=features,
+                    collection=fc,
                     reducer=reducer,
                     scale=selected_satellite.get('pixelSize', 1000)
                 )
@@ -1058,18 +1199,15 @@ def run_extraction(settings_service: SettingsService, export_method: str):
                         # (e.g. 00:00 vs 00:30 for IMERG 30-min) are distinguishable
                         # without duplicating the date column.
                         props['time'] = date.format('HH:mm')
-                    # For a single-band image, GEE's reduceRegions names the output
-                    # after the reducer (e.g. 'mean'), not the band. Rename it so
-                    # the column is always identifiable regardless of reducer choice.
-                    # For multi-band images GEE already uses the band names.
-                    if len(selected_bands) == 1:
-                        props[selected_bands[0]] = feature.get(reducer_name)
                     return feature.set(props)
                 
                 return reduced.map(add_date)
             
-            # Map over collection to extract values
-            extracted = collection.map(extract_values).flatten()
+            def extract_from(fc):
+                """Map over collection to extract values for every feature of fc."""
+                return collection.map(lambda image: extract_values(image, fc)).flatten()
+            
+            extracted = extract_from(features)
 
             # Build a logical column order for the output CSV -------------
             _time_cols = ['date']
@@ -1114,10 +1252,13 @@ def run_extraction(settings_service: SettingsService, export_method: str):
                     fileFormat='CSV',
                     selectors=ordered_columns
                 )
-                task.start()
-                
-                # Get task ID
-                task_id = task.status()['id']
+                # Hold the ee session so another session's high-volume download
+                # cannot switch the endpoint while the task is submitted
+                with ee_session(project_id):
+                    task.start()
+                    
+                    # Get task ID
+                    task_id = task.status()['id']
                 
                 st.success(f"✅ Task submitted successfully!")
                 st.info(f"**Task ID:** `{task_id}`")
@@ -1125,8 +1266,7 @@ def run_extraction(settings_service: SettingsService, export_method: str):
                 st.markdown(f"📊 [View in GEE Console](https://code.earthengine.google.com/tasks)")
                 
                 # Save to history
-                # Save to history
-                history_manager = HistoryManager()
+                history_manager = get_history_manager()
                 history_entry = {
                     'satellite': selected_satellite['id'],
                     'bands': selected_bands,
@@ -1134,7 +1274,6 @@ def run_extraction(settings_service: SettingsService, export_method: str):
                     'geometry_source': 'Points' if selected_points else ('Shapefile' if st.session_state.get('uploaded_shapefile') else 'GADM'),
                     'num_points': len(selected_points) if selected_points else 0,
                     'selected_points': selected_points,  # Save full points list
-                    'selected_points': selected_points,  # Save full points list
                     'gadm_selection': {k: v for k, v in st.session_state.get('gadm_selection', {}).items() if k != 'gdf'}, # Save GADM details without GDF
                     'gadm_regions': st.session_state.get('gadm_regions'), # Save specific regions if any
                     'uploaded_shapefile': st.session_state.get('uploaded_shapefile'), # Save shapefile path
@@ -1144,7 +1283,14 @@ def run_extraction(settings_service: SettingsService, export_method: str):
                     'task_id': task_id,
                     'custom_filename': task_name
                 }
-                history_manager.add_entry(history_entry)
+                # Skip re-runs of the same configuration (the task ID differs on every run)
+                history_key = hash(json.dumps(
+                    {k: v for k, v in history_entry.items() if k != 'task_id'},
+                    sort_keys=True, default=str
+                ))
+                if st.session_state.get('last_history_key') != history_key:
+                    history_manager.add_entry(history_entry)
+                    st.session_state['last_history_key'] = history_key
                 
             else:
                 # Local download - get as CSV directly
@@ -1152,41 +1298,68 @@ def run_extraction(settings_service: SettingsService, export_method: str):
                 st.info("Fetching data... This may take a moment for large datasets.")
                 
                 try:
-                    # Get the data directly (limited to ~5000 features)
-                    data = extracted.getInfo()
+                    # Split points into chunks so each request stays under the
+                    # interactive size/time limits, and fetch the chunks concurrently
+                    if len(selected_points) > FETCH_CHUNK_SIZE:
+                        # Each chunk carries only its own points (ids offset by start), so a
+                        # request never ships or rebuilds the full point list server-side
+                        pts_key = tuple((p['lat'], p['lon']) for p in selected_points)
+                        chunks = [
+                            extract_from(_point_feature_collection(pts_key[start:start + FETCH_CHUNK_SIZE], start))
+                            for start in range(0, len(pts_key), FETCH_CHUNK_SIZE)
+                        ]
+                    else:
+                        chunks = [extracted]
                     
-                    if data and 'features' in data:
-                        # Convert to pandas dataframe
-                        import pandas as pd
-                        
-                        rows = []
-                        for feature in data['features']:
-                            props = feature.get('properties', {})
-                            rows.append(props)
-                        
-                        df = pd.DataFrame(rows)
-
+                    # Walk the fetched rows once, filling one list per property.
+                    # GEE omits null properties, so columns are padded with None
+                    # up to the current row before each append (and at the end).
+                    columns = {}
+                    n_rows = 0
+                    progress = st.progress(0.0, text="Fetching data...")
+                    # The (process-global) endpoint switch only lasts for the fetch itself;
+                    # ee_session keeps other sessions from initializing inside that window.
+                    # Standard-endpoint fetches need no lock and run concurrently.
+                    with (ee_session(project_id, opt_url) if opt_url else nullcontext()), \
+                            ThreadPoolExecutor(max_workers=min(FETCH_MAX_WORKERS, len(chunks))) as pool:
+                        # map() keeps the chunk order, so rows come back grouped by point chunk
+                        for done, chunk_rows in enumerate(pool.map(_fetch_feature_properties, chunks), start=1):
+                            for props in chunk_rows:
+                                for k, v in props.items():
+                                    column = columns.setdefault(k, [])
+                                    if len(column) < n_rows:
+                                        column.extend([None] * (n_rows - len(column)))
+                                    column.append(v)
+                                n_rows += 1
+                            progress.progress(done / len(chunks), text=f"Fetched {n_rows} rows")
+                    progress.empty()
+                    for column in columns.values():
+                        column.extend([None] * (n_rows - len(column)))
+                    
+                    if n_rows:
                         # Reorder columns into a logical order;
                         # preserve any unexpected extra columns at the end.
-                        _extra = [c for c in df.columns
-                                  if c not in ordered_columns]
-                        _final_cols = [c for c in ordered_columns + _extra
-                                       if c in df.columns]
-                        df = df[_final_cols]
-
-                        # Provide download button
-                        csv_data = df.to_csv(index=False)
+                        _extra = [c for c in columns if c not in ordered_columns]
+                        _final_cols = [c for c in ordered_columns + _extra if c in columns]
+                        
+                        # Build an Arrow table directly (written as Feather/Parquet by Arrow, CSV by pandas)
+                        table = pa.table({c: _arrow_column(columns[c]) for c in _final_cols})
+
+                        # Provide download button; the file is only serialized when clicked
+                        output_format = settings_service.get_setting("defaults", "output_format", "csv")
+                        if output_format not in OUTPUT_MIME_TYPES:
+                            output_format = "csv"
                         st.success("✅ Data extracted successfully!")
                         st.download_button(
-                            label="📥 Download CSV",
-                            data=csv_data,
-                            file_name=f"{task_name}.csv",
-                            mime="text/csv"
+                            label=f"📥 Download {output_format.upper()}",
+                            data=partial(_serialize_table, table, output_format),
+                            file_name=f"{task_name}.{output_format}",
+                            mime=OUTPUT_MIME_TYPES[output_format]
                         )
                         
                         # Show preview
                         st.subheader("Data Preview")
-                        st.dataframe(df.head(20))
+                        st.dataframe(table.slice(0, 20).to_pandas())
                     else:
                         st.warning("No data returned. Try adjusting filters or using Drive export for large datasets.")
                         
@@ -1196,37 +1369,161 @@ def run_extraction(settings_service: SettingsService, export_method: str):
         
         except Exception as e:
             st.error(f"❌ Extraction failed: {str(e)}")
-            import traceback
-            st.code(traceback.format_exc())
+            # Full tracebacks are only useful when debugging the app itself
+            if settings_service.get_setting("defaults", "debug", False):
+                import traceback
+                st.code(traceback.format_exc())
+
+
+def _fetch_feature_properties(fc) -> list:
+    """Properties of every feature in fc, fetched page by page with ee.data.computeFeatures."""
+    rows = []
+    params = {'expression': fc, 'pageSize': COMPUTE_FEATURES_PAGE_SIZE}
+    while True:
+        page = ee.data.computeFeatures(params)
+        # Geometries are not needed in the output; drop them page by page
+        rows.extend(feature.get('properties', {}) for feature in page.get('features', []))
+        page_token = page.get('nextPageToken')
+        if not page_token:
+            return rows
+        params = {**params, 'pageToken': page_token}
+
+
+def _serialize_table(table: pa.Table, output_format: str) -> bytes:
+    """Serialize the extracted table as CSV, Feather or Parquet bytes."""
+    buffer = io.BytesIO()
+    if output_format == 'feather':
+        import pyarrow.feather as pafeather
+        pafeather.write_feather(table, buffer)
+    elif output_format == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, buffer, compression='zstd')
+    else:
+        # CSV stays on pandas, the writer this app has always used for its downloads
+        table.to_pandas().to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+
+def _arrow_column(values: list) -> pa.Array:
+    """Arrow array for one output column; mixed-type columns fall back to strings."""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def _geometry_service(settings_service: SettingsService) -> GeometryService:
+    """Shared GeometryService configured from the current settings."""
+    return _cached_geometry_service(
+        settings_service.get_setting("paths", "cache_folder", "./.cache/"),
+        float(settings_service.get_setting("defaults", "simplify_tolerance", DEFAULT_SIMPLIFY_TOLERANCE)),
+    )
+
+
+@st.cache_resource(max_entries=4)
+def _cached_geometry_service(cache_folder: str, simplify_tolerance: float) -> GeometryService:
+    """One GeometryService per (cache folder, tolerance), reused across reruns."""
+    return GeometryService(cache_folder=cache_folder, simplify_tolerance=simplify_tolerance)
+
+
+# ee objects are small client-side proxies, but bound the caches so that every
+# distinct point set / region selection doesn't stay pinned for the process lifetime
+@st.cache_resource(max_entries=32, ttl=3600, show_spinner=False)
+def _point_features(pts_key: tuple):
+    """ee.Geometry and ee.FeatureCollection for manual points, cached per (lat, lon) tuple."""
+    feature_collection = _point_feature_collection(pts_key)
+    
+    # filterBounds needs the points themselves: a bounding box would also match
+    # tiles/zones that contain no point (and spans the globe across the antimeridian)
+    if len(pts_key) == 1:
+        geometry = ee.Geometry.Point([pts_key[0][1], pts_key[0][0]])
+    else:
+        geometry = ee.Geometry.MultiPoint([[lon, lat] for lat, lon in pts_key])
+    
+    return geometry, feature_collection
+
+
+def _point_feature_collection(pts_key: tuple, offset: int = 0) -> ee.FeatureCollection:
+    """ee.FeatureCollection of (lat, lon) points; point_id counts from offset + 1."""
+    # Send the points as one ee.List of [lon, lat, id] and build the features server-side
+    coords = ee.List([[lon, lat, offset + i + 1] for i, (lat, lon) in enumerate(pts_key)])
+    
+    def make_feature(el):
+        el = ee.List(el)
+        return ee.Feature(ee.Geometry.Point([el.get(0), el.get(1)]), {
+            'point_id': el.get(2),
+            'latitude': el.get(1),
+            'longitude': el.get(0)
+        })
+    
+    return ee.FeatureCollection(coords.map(make_feature))
+
 
+@st.cache_resource(max_entries=8, ttl=3600, show_spinner=False)
+def _gadm_features(country: str, admin_level: int, regions: tuple, simplify_tolerance: float, _gdf):
+    """ee.Geometry and ee.FeatureCollection for a GADM selection, cached per (country, level, regions, tolerance)."""
+    gdf = _gdf
+    
+    # WORKAROUND for pygadm pandas compatibility bug:
+    # Cannot use gdf.__geo_interface__ or subset the gdf
+    # Instead, access geometry series directly and build EE features manually
+    
+    # Simplify geometries to avoid GEE payload limits and convert them to GeoJSON,
+    # both vectorized over the whole geometry array
+    geojson_strings = shapely.to_geojson(shapely.simplify(gdf.geometry.to_numpy(), simplify_tolerance))
+    # Parse all geometries with a single loads() call on one JSON array
+    geom_dicts = json_utils.loads("[" + ",".join(geojson_strings.tolist()) + "]")
+    
+    # Helper to convert numpy/pandas types to standard python types for JSON serialization
+    def convert_types(obj):
+        if isinstance(obj, (int, float, str, bool, type(None))):
+            return obj
+        if hasattr(obj, 'item'): 
+            return obj.item()
+        return str(obj)
+
+    # User request: Keep only GID_* and NAME_* columns from GADM
+    # (read column by column; the gdf itself is never subset)
+    prop_columns = {
+        c: [convert_types(v) for v in gdf[c].tolist()]
+        for c in gdf.columns if c.startswith(('GID_', 'NAME_'))
+    }
+    
+    # Per-feature GID_/NAME_ values (zipped column-wise) and the metadata
+    # shared by every feature, both computed once outside the feature loop
+    prop_names = list(prop_columns)
+    prop_rows = zip(*prop_columns.values()) if prop_names else repeat(())
+    shared_props = {'source': 'gadm', 'country': str(country), 'admin_level': int(admin_level)}
+    
+    # One GeoJSON FeatureCollection, deserialized by EE in a single call
+    fc_geojson = {
+        'type': 'FeatureCollection',
+        'features': [
+            {
+                'type': 'Feature',
+                'geometry': geom_dict,
+                'properties': {**dict(zip(prop_names, values)), **shared_props, 'feature_id': i + 1}
+            }
+            for i, (geom_dict, values) in enumerate(zip(geom_dicts, prop_rows))
+        ]
+    }
+    feature_collection = ee.FeatureCollection(fc_geojson)
+    
+    # Get geometry as union of all features
+    geometry = feature_collection.geometry()
+    
+    return geometry, feature_collection
 
-def build_geometry_and_features():
+
+def build_geometry_and_features(settings_service: SettingsService):
     """Build ee.Geometry and ee.FeatureCollection from session state inputs."""
-    geometry_service = GeometryService()
+    geometry_service = _geometry_service(settings_service)
     
     # Check for manual points
     points = st.session_state.get('selected_points', [])
     if points:
-        # Create features with point IDs
-        features = []
-        for i, p in enumerate(points):
-            point = ee.Geometry.Point([p['lon'], p['lat']])
-            feature = ee.Feature(point, {
-                'point_id': i + 1,
-                'latitude': p['lat'],
-                'longitude': p['lon']
-            })
-            features.append(feature)
-        
-        feature_collection = ee.FeatureCollection(features)
-        
-        if len(points) == 1:
-            geometry = ee.Geometry.Point([points[0]['lon'], points[0]['lat']])
-        else:
-            coords = [[p['lon'], p['lat']] for p in points]
-            geometry = ee.Geometry.MultiPoint(coords)
-        
-        return geometry, feature_collection
+        # Reuse the ee objects across runs while the points are unchanged
+        return _point_features(tuple((p['lat'], p['lon']) for p in points))
     
     # Check for imported file (lazy: reads file on-demand, not from session state)
     imported = st.session_state.get('imported_geodata')
@@ -1234,8 +1531,8 @@ def build_geometry_and_features():
     if imported and import_path:
         geo_type = imported['type']
         
-        # Load file on-demand with simplification for shapes
-        simplify = 0.01 if geo_type == 'shapes' else 0.0
+        # Load file on-demand; shapes use the configured simplification
+        simplify = None if geo_type == 'shapes' else 0.0
         gdf = geometry_service.load_file(import_path, simplify_tolerance=simplify)
         
         # Determine which column to use as feature identifier
@@ -1307,68 +1604,14 @@ def build_geometry_and_features():
     # Check for GADM
     gadm_selection = st.session_state.get('gadm_selection')
     if gadm_selection and 'gdf' in gadm_selection:
-        # Use the cached GeoDataFrame
-        gdf = gadm_selection['gdf']
-        
-        # WORKAROUND for pygadm pandas compatibility bug:
-        # Cannot use gdf.__geo_interface__ or subset the gdf
-        # Instead, access geometry series directly and build EE features manually
-        
-        # Simplify geometries to avoid GEE payload limits
-        simplified_geoms = gdf.geometry.simplify(tolerance=0.01)
-        
-        # Build EE features from each geometry
-        ee_features = []
-        
-        # Helper to convert numpy/pandas types to standard python types for JSON serialization
-        def convert_types(obj):
-            if isinstance(obj, (int, float, str, bool, type(None))):
-                return obj
-            if hasattr(obj, 'item'): 
-                return obj.item()
-            return str(obj)
-
-        for i in range(len(gdf)):
-            # Get geometry
-            geom = simplified_geoms.iloc[i]
-            
-            # Get properties for this feature
-            # We use the original gdf to get properties
-            props = gdf.iloc[i].drop('geometry').to_dict()
-            
-            # Filter and sanitise properties
-            # User request: Keep only GID_* and NAME_* columns from GADM
-            clean_props = {}
-            for k, v in props.items():
-                # Check if column starts with GID_ or NAME_
-                if k.startswith(('GID_', 'NAME_')):
-                    clean_props[k] = convert_types(v)
-            
-            # Add basic metadata
-            clean_props.update({
-                'source': 'gadm',
-                'feature_id': i + 1,
-                'country': gadm_selection.get('name', ''),
-                'admin_level': gadm_selection.get('admin_level', 0)
-            })
-
-            # Convert shapely geometry to GeoJSON dict
-            geom_dict = geom.__geo_interface__
-            
-            # Create EE geometry from GeoJSON
-            ee_geom = ee.Geometry(geom_dict)
-            
-            # Create feature with all properties
-            ee_feature = ee.Feature(ee_geom, clean_props)
-            ee_features.append(ee_feature)
-        
-        # Create FeatureCollection
-        feature_collection = ee.FeatureCollection(ee_features)
-        
-        # Get geometry as union of all features
-        geometry = feature_collection.geometry()
-        
-        return geometry, feature_collection
+        # Reuse the ee objects across runs while the selection is unchanged
+        return _gadm_features(
+            gadm_selection.get('name', ''),
+            gadm_selection.get('admin_level', 0),
+            tuple(gadm_selection.get('regions', ())),
+            geometry_service.simplify_tolerance,
+            gadm_selection['gdf']
+        )
     elif gadm_selection:
         # Fallback to GeometryService if no gdf in selection
         geometry = geometry_service.parse_geometry(gadm_selection, 'gadm')
@@ -5,10 +5,12 @@ Provides reusable functions for creating Folium maps with consistent
 base layers, overlays, rendering via st_folium, and drag-to-resize.
 """
 import folium
-import json
+from folium.plugins import FastMarkerCluster
 from jinja2 import Template
 from streamlit_folium import st_folium
 
+from src.infrastructure.utils import json_utils
+
 
 # --- Constants ---
 
@@ -24,6 +26,9 @@ DEFAULT_STYLE = {
     'fillOpacity': 0.3,
 }
 
+# Above this many points, markers are drawn client-side by FastMarkerCluster
+FAST_MARKER_THRESHOLD = 50
+
 DEFAULT_HIGHLIGHT = {
     'fillColor': '#ffcc00',
     'color': '#ffcc00',
@@ -114,6 +119,10 @@ def add_geojson_overlay(m, geojson_data, style=None, highlight=None,
 def add_markers(m, points, color='red', icon='info-sign', label_format=None):
     """Add point markers to a Folium map.
 
+    Up to FAST_MARKER_THRESHOLD points get individual markers with popups.
+    Larger sets are rendered with a single FastMarkerCluster (one JS array,
+    no per-point popups) to keep the map HTML small.
+
     Args:
         m: folium.Map to add markers to.
         points: List of dicts with 'lat' and 'lon' keys,
@@ -126,6 +135,11 @@ def add_markers(m, points, color='red', icon='info-sign', label_format=None):
     Returns:
         The map (modified in-place).
     """
+    if len(points) > FAST_MARKER_THRESHOLD:
+        data = [[pt.y, pt.x] if hasattr(pt, 'y') else [pt['lat'], pt['lon']] for pt in points]
+        FastMarkerCluster(data=data).add_to(m)
+        return m
+
     for i, pt in enumerate(points):
         if hasattr(pt, 'y') and hasattr(pt, 'x'):
             # Shapely geometry
@@ -168,9 +182,7 @@ def render_map(m, key, height=800, width=None, fit_bounds=None):
         bounds = fit_bounds  # [minx, miny, maxx, maxy]
         m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
 
-    folium.LayerControl(position="topright", collapsed=False).add_to(m)
-
-    DragHandlePlugin(map_key=key).add_to(m)
+    _add_map_controls(m, key)
 
     return st_folium(m, height=height, width=width, key=key)
 
@@ -196,11 +208,21 @@ def render_map_display(m, key, height=800, width=None, fit_bounds=None):
         bounds = fit_bounds
         m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
 
+    _add_map_controls(m, key)
+
+    st_folium(m, height=height, width=width, key=key, returned_objects=[])
+
+
+def _add_map_controls(m, key):
+    """Add LayerControl and the drag handle once, so a cached map can be re-rendered."""
+    if getattr(m, '_gee_controls_added', False):
+        return
+
     folium.LayerControl(position="topright", collapsed=False).add_to(m)
 
     DragHandlePlugin(map_key=key).add_to(m)
 
-    st_folium(m, height=height, width=width, key=key, returned_objects=[])
+    m._gee_controls_added = True
 
 
 def gdf_to_geojson(gdf):
@@ -217,7 +239,30 @@ def gdf_to_geojson(gdf):
     """
     import geopandas as gpd
     gdf_vanilla = gpd.GeoDataFrame(gdf, geometry='geometry')
-    return json.loads(gdf_vanilla.to_json())
+    return json_utils.loads(gdf_vanilla.to_json())
+
+
+def gdf_to_display_geojson(gdf, pixels=500):
+    """Convert a GeoDataFrame to GeoJSON simplified for on-screen display.
+
+    The tolerance is the larger bounding-box side divided by ``pixels``
+    (about one screen pixel when the map is fitted to the bounds), which
+    shrinks the payload sent to the browser without visible change.
+
+    Args:
+        gdf: GeoDataFrame (may be a pygadm subclass).
+        pixels: Approximate map width in pixels the data is fitted to.
+
+    Returns:
+        dict: Parsed GeoJSON with simplified geometries and all properties.
+    """
+    import geopandas as gpd
+    gdf_vanilla = gpd.GeoDataFrame(gdf, geometry='geometry', copy=True)
+    minx, miny, maxx, maxy = gdf_vanilla.total_bounds
+    tolerance = max(maxx - minx, maxy - miny) / pixels
+    if tolerance > 0:
+        gdf_vanilla['geometry'] = gdf_vanilla.geometry.simplify(tolerance, preserve_topology=True)
+    return gdf_to_geojson(gdf_vanilla)
 
 
 def extract_gadm_display_columns(geojson_data, max_level=3):
@@ -247,29 +292,6 @@ def extract_gadm_display_columns(geojson_data, max_level=3):
     return display_cols
 
 
-def fetch_gadm_boundaries(country, admin_level):
-    """Fetch GADM boundaries via pygadm, with Streamlit caching.
-
-    Args:
-        country: Country name string.
-        admin_level: Administrative level (0, 1, or 2).
-
-    Returns:
-        GeoDataFrame with boundary geometries.
-    """
-    import pygadm
-    import streamlit as st
-
-    @st.cache_data(show_spinner=False)
-    def _fetch(name, level):
-        if level > 0:
-            return pygadm.Items(name=name, content_level=level)
-        else:
-            return pygadm.Items(name=name)
-
-    return _fetch(country, admin_level)
-
-
 class DragHandlePlugin(folium.MacroElement):
     """Folium plugin that attaches a drag-to-resize handle to its map iframe.
 
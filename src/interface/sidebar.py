@@ -4,9 +4,22 @@ Contains: Authentication status, Settings popup, Task monitor, History loader.
 """
 import streamlit as st
 import ee
+import copy
+import os
+import threading
+from datetime import datetime
 from pathlib import Path
-from src.domain.extractors.BaseExtractor import BaseExtractor
+from types import MappingProxyType
+from typing import Mapping
+from src.domain.extractors.BaseExtractor import BaseExtractor, initialize_ee
 from src.infrastructure.persistence.HistoryManager import HistoryManager
+from src.application.services.GeometryService import DEFAULT_SIMPLIFY_TOLERANCE
+
+
+@st.cache_resource
+def get_history_manager() -> HistoryManager:
+    """Shared HistoryManager, so the history file is read once instead of on every rerun."""
+    return HistoryManager()
 
 
 def render(settings_service):
@@ -41,22 +54,17 @@ def render_auth_status(settings_service):
         st.session_state.gee_initialized = False
         st.session_state.gee_error = None
     
-    # Try to initialize if not already done
-    if not st.session_state.gee_initialized:
+    # Try to initialize if not already done (and no sign-in is in progress)
+    if not st.session_state.gee_initialized and 'auth_job' not in st.session_state:
         try:
-            ee.Initialize(project=project_id)
+            # Standard endpoint; the high-volume one is only used during local downloads.
+            # A no-op when the process is already initialized (e.g. by another session).
+            initialize_ee(project_id)
             st.session_state.gee_initialized = True
             st.session_state.gee_error = None
         except ee.EEException as e:
-            # Try to authenticate first
-            try:
-                ee.Authenticate()
-                ee.Initialize(project=project_id)
-                st.session_state.gee_initialized = True
-                st.session_state.gee_error = None
-            except Exception as auth_err:
-                st.session_state.gee_initialized = False
-                st.session_state.gee_error = str(auth_err)
+            # Authenticate in the background, then initialize once it completes
+            _start_auth_job()
         except Exception as e:
             st.session_state.gee_initialized = False
             st.session_state.gee_error = str(e)
@@ -64,21 +72,60 @@ def render_auth_status(settings_service):
     # Display status
     if st.session_state.gee_initialized:
         st.success(f"🟢 GEE Connected: `{project_id}`")
+    elif 'auth_job' in st.session_state:
+        _render_auth_job(project_id)
     else:
         st.error("🔴 GEE Disconnected")
         if st.session_state.gee_error:
             st.caption(f"Error: {st.session_state.gee_error[:50]}...")
         
         if st.button("🔄 Reconnect", use_container_width=True):
-            try:
-                ee.Authenticate()
-                ee.Initialize(project=project_id)
-                st.session_state.gee_initialized = True
-                st.session_state.gee_error = None
-                st.rerun()
-            except Exception as auth_err:
-                st.session_state.gee_error = str(auth_err)
-                st.error(f"Auth failed: {auth_err}")
+            _start_auth_job()
+            st.rerun()
+
+
+def _start_auth_job():
+    """Runs ee.Authenticate (an interactive browser flow) on a background thread."""
+    # A plain dict: the worker thread must not touch st.session_state itself
+    job = {'done': False, 'error': None}
+    
+    def authenticate():
+        try:
+            ee.Authenticate()
+        except Exception as e:
+            job['error'] = str(e)
+        finally:
+            job['done'] = True
+    
+    st.session_state.auth_job = job
+    threading.Thread(target=authenticate, daemon=True).start()
+
+
+@st.fragment(run_every=2)
+def _render_auth_job(project_id: str):
+    """Polls the background sign-in and initializes Earth Engine once it finishes."""
+    job = st.session_state.get('auth_job')
+    if job is None:
+        return
+    if not job['done']:
+        st.info("⏳ Waiting for Earth Engine sign-in in your browser...")
+        return
+    
+    del st.session_state['auth_job']
+    if job['error']:
+        st.session_state.gee_initialized = False
+        st.session_state.gee_error = job['error']
+    else:
+        try:
+            # Fresh credentials: initialize again even if already on this project
+            initialize_ee(project_id, force=True)
+            st.session_state.gee_initialized = True
+            st.session_state.gee_error = None
+        except Exception as auth_err:
+            st.session_state.gee_initialized = False
+            st.session_state.gee_error = str(auth_err)
+    # Status is shown outside this fragment: rerun the whole app
+    st.rerun()
 
 
 @st.dialog("⚙️ Settings")
@@ -108,6 +155,15 @@ def settings_dialog(settings_service):
         help="Folder name in your Google Drive for exports"
     )
     
+    # High-volume endpoint
+    current_highvolume = settings_service.get_setting("gee", "use_highvolume", False)
+    new_highvolume = st.checkbox(
+        "Use High-Volume Endpoint",
+        value=current_highvolume,
+        help="Sends local downloads to the high-volume GEE endpoint, which handles "
+             "many parallel requests better. Drive exports keep the standard endpoint."
+    )
+    
     st.markdown("### Local Paths")
     
     # Local download folder
@@ -137,6 +193,29 @@ def settings_dialog(settings_service):
         index=reducers.index(current_reducer) if current_reducer in reducers else 0
     )
     
+    # Geometry simplification
+    current_tolerance = float(settings_service.get_setting("defaults", "simplify_tolerance", DEFAULT_SIMPLIFY_TOLERANCE))
+    new_tolerance = st.number_input(
+        "Simplify Tolerance (degrees)",
+        min_value=0.0,
+        value=current_tolerance,
+        step=0.001,
+        format="%.4f",
+        help="Simplifies shapes before sending them to GEE (0 = off). "
+             "Roughly the analysis scale in metres / 111320."
+    )
+    
+    # Local download format
+    output_formats = ['csv', 'feather', 'parquet']
+    current_format = settings_service.get_setting("defaults", "output_format", "csv")
+    new_format = st.selectbox(
+        "Output Format",
+        options=output_formats,
+        index=output_formats.index(current_format) if current_format in output_formats else 0,
+        help="File format for local downloads. Feather and Parquet are smaller and much "
+             "faster to load back than CSV. Drive exports are always CSV."
+    )
+    
     # Save button
     col1, col2 = st.columns(2)
     with col1:
@@ -144,11 +223,14 @@ def settings_dialog(settings_service):
             # Update all settings
             settings_service.update_setting("gee", "project_id", new_project)
             settings_service.update_setting("gee", "drive_folder", new_drive_folder)
+            settings_service.update_setting("gee", "use_highvolume", new_highvolume)
             settings_service.update_setting("paths", "download_folder_local", new_local_path)
             settings_service.update_setting("paths", "cache_folder", new_cache)
             settings_service.update_setting("defaults", "default_reducer", new_reducer)
+            settings_service.update_setting("defaults", "simplify_tolerance", new_tolerance)
+            settings_service.update_setting("defaults", "output_format", new_format)
             
-            # Force re-initialization if project changed
+            # Force re-initialization if project changed (the endpoint is chosen per run)
             if new_project != current_project:
                 st.session_state.gee_initialized = False
             
@@ -166,13 +248,26 @@ def render_settings_popup(settings_service):
         settings_dialog(settings_service)
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_tasks() -> list:
+    """Recent GEE tasks, shared by all sessions for 30s so repeated Refresh clicks
+    (from this or other sessions) don't each hit the REST API.
+
+    Errors are raised rather than returned as an empty list: st.cache_data
+    does not cache exceptions, so a failed fetch is retried on the next click
+    instead of showing "No recent tasks" for 30s.
+    """
+    return BaseExtractor.monitor_tasks(limit=5, raise_errors=True)
+
+
 def render_task_monitor():
     """Displays recent GEE tasks."""
     st.subheader("📋 Tasks")
     
+    # Tasks are only fetched on the rerun triggered by the button, never on other reruns
     if st.button("🔄 Refresh Tasks", use_container_width=True):
         try:
-            tasks = BaseExtractor.monitor_tasks(limit=5)
+            tasks = _fetch_tasks()
             if tasks:
                 for task in tasks:
                     state = task.get('state', 'UNKNOWN')
@@ -195,17 +290,52 @@ def render_task_monitor():
             st.warning(f"Could not fetch tasks: {str(e)[:50]}")
 
 
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _history_options(history_file: str, mtime_ns: int, n_entries: int) -> Mapping[str, dict]:
+    """Selectbox label -> history entry, rebuilt only when the history changes.
+
+    Every history write changes mtime_ns and so creates a new cache key; only
+    the current one is ever looked up again, so keep just the last couple.
+
+    The entries are the HistoryManager's own dicts, shared by every session:
+    treat them as read-only and deep-copy an entry before handing it to a session.
+    """
+    history = get_history_manager().get_history()
+    return MappingProxyType(
+        {f"{_format_history_timestamp(h['timestamp'])} - {h['satellite'][:15]}": h for h in history}
+    )
+
+
+def _format_history_timestamp(timestamp: str) -> str:
+    """Displays a history timestamp in local time.
+
+    New entries are stored as timezone-aware UTC; older ones are naive local
+    time and are shown as-is.
+    """
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return timestamp[:16]
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone()
+    return parsed.strftime("%Y-%m-%d %H:%M")
+
+
 def render_history_loader():
     """Loads previous run configurations."""
     st.subheader("📜 History")
-    history_manager = HistoryManager()
+    history_manager = get_history_manager()
     history = history_manager.get_history()
     
     if not history:
         st.caption("No job history available.")
         return
     
-    options = {f"{h['timestamp'][:16]} - {h['satellite'][:15]}": h for h in history}
+    try:
+        history_mtime = os.stat(history_manager.history_file).st_mtime_ns
+    except OSError:
+        history_mtime = 0
+    options = _history_options(str(history_manager.history_file), history_mtime, len(history))
     selected_option = st.selectbox(
         "Load Previous Run",
         options=list(options.keys()),
@@ -213,7 +343,8 @@ def render_history_loader():
     )
     
     if st.button("📥 Load Settings", use_container_width=True):
-        selected_run = options[selected_option]
+        # History entries are shared across sessions; give this session its own copy
+        selected_run = copy.deepcopy(options[selected_option])
         st.session_state['loaded_settings'] = selected_run
         st.success("Settings loaded!")
         st.rerun()